@@ -10,8 +10,8 @@ ESPN Fantasy Baseball Table Parser
 #
 #
 import sys
-if sys.version_info[:2] < (2, 7):
-    m = "Python 2.7 or later is required for PyVISSIM (%d.%d detected)."
+if sys.version_info[:2] < (3, 6):
+    m = "Python 3.6 or later is required for espn_tables (%d.%d detected)."
     raise ImportError(m % sys.version_info[:2])
 del sys
-from espn_tables import *
+from espn_tables.espn_tables import *
@@ -1,9 +1,117 @@
 import pandas as pd
 import numpy as np
 import re
+import requests
+from concurrent.futures import ThreadPoolExecutor
 from lxml import etree
-from lxml.html import tostring
-from urllib import urlencode
+from urllib.parse import urlencode
+
+try:
+    import requests_cache
+except ImportError:
+    # Optional dependency; without it every fetch goes to ESPN.
+    requests_cache = None
+
+# Compiled once at import; these all sit on per-row hot paths.
+_TEAMID_RE = re.compile(r'teamId=(\d+)')
+_AUCTION_RE = re.compile(u'^(?P<PLAYER>[^,]+), (?P<TEAM>\\w+)\xa0'
+                         u'(?P<POS>\\w+)(?P<KEEPER>(?:\xa0\xa0K)?)$')
+_ACTIVE_RE = re.compile(u'^(?P<PLAYER>[^,]+), (?P<TEAM>\\w+)\xa0'
+                        u'(?P<POS>.+?)(?P<DTD>(?:\xa0\xa0DTD)?)$')
+_UNNAMED_RE = re.compile(r'Unnamed: \d+')
+_SUBHEAD_RE = re.compile(r'1\d')
+_ADD_RE = re.compile(r'(\w+) added (.+?), \w+ \w+ from (Waivers|Free Agency)')
+_DROP_RE = re.compile(r'(\w+) dropped (.+?), \w+ \w+ to (Waivers|Free Agency)')
+_TRADE_RE = re.compile(r'(\w+) traded (.+?), \w+ \w+ to (\w+)')
+# XPath expressions compile to reusable C-level objects; build them once
+# instead of re-parsing the expression string on every .xpath() call.
+_HEAD_XP = etree.XPath('.//tr[@class="tableHead"]|.//td[@class="tableHead"]')
+_SUBHEAD_XP = etree.XPath('.//tr[@class="tableSubHead"]')
+_TDS_XP = etree.XPath('.//td')
+_TEXTS_XP = etree.XPath('.//text()')
+_ADD_DROP_KEY = u'Transaction\xa0\xa0Add/Drop'
+_ADD_KEY = u'Transaction\xa0\xa0Add'
+_DROP_KEY = u'Transaction\xa0\xa0Drop'
+_TRADE_KEY = u'Transaction\xa0\xa0Trade Processed'
+
+
+def _parseAddDrop(detail):
+    return [_DROP_RE.findall(detail)[0], _ADD_RE.findall(detail)[0][::-1]]
+
+
+def _parseAdd(detail):
+    return [match[::-1] for match in _ADD_RE.findall(detail)]
+
+
+def _transactionParser(rowType):
+    """ Resolve the DETAIL parser for one TYPE value, so each cell is
+        scanned by exactly one pattern and the result is a (FROM, PLAYER,
+        TO) tuple list. Add/Drop must be checked before its Add and Drop
+        prefixes.
+    """
+    if rowType.startswith(_ADD_DROP_KEY):
+        return _parseAddDrop
+    if rowType.startswith(_TRADE_KEY):
+        return _TRADE_RE.findall
+    if rowType.startswith(_ADD_KEY):
+        return _parseAdd
+    if rowType.startswith(_DROP_KEY):
+        return _DROP_RE.findall
+    return None
+
+
+def _convertNumericCols(df):
+    """ Convert the columns whose values actually parse as numbers; a
+        blanket errors='ignore' pass tries and silently reverts every
+        string column, doubling the work. Columns are classified by
+        test-parsing their first non-null values. Checks for non-numeric
+        dtypes rather than == 'object' because pandas 3 infers the str
+        dtype for the string columns _tableToDf builds.
+        Input: dataframe
+        Output: the same dataframe, converted in place
+    """
+    numericCols = [col for col in df.columns
+                   if not pd.api.types.is_numeric_dtype(df[col]) and
+                   pd.to_numeric(df[col].dropna().head(),
+                                 errors='coerce').notna().all()]
+    df[numericCols] = df[numericCols].apply(pd.to_numeric, errors='coerce')
+    return df
+
+
+_CATEGORY_COLS = ('MANAGER', 'TEAM', 'POS')
+
+
+def _categorize(df, cols=_CATEGORY_COLS):
+    """ Store low-cardinality label columns as categoricals: the codes
+        compare as small ints and replace an object pointer per row, which
+        also speeds any downstream groupby on them.
+        Input: dataframe, column names tuple
+        Output: the same dataframe, converted in place
+    """
+    for col in cols:
+        if col in df:
+            df[col] = df[col].astype('category')
+    return df
+
+
+def _tableToDf(table, header=None, skiprows=0):
+    """ Build a dataframe straight from a parsed lxml table element,
+        avoiding the tostring/read_html round-trip that serializes the
+        table and parses it all over again.
+        Input: table lxml element, header row index int or None,
+        skiprows int
+        Output: pandas dataframe
+    """
+    rows = [[''.join(td.itertext()).strip() or np.nan
+             for td in tr.iterchildren('td')]
+            for tr in table.iterchildren('tr')]
+    if header is None:
+        return pd.DataFrame(rows[skiprows:])
+    # Name blank header cells the way read_html did so the downstream
+    # 'Unnamed' column filters keep working.
+    columns = [name if isinstance(name, str) else 'Unnamed: %d' % idx
+               for idx, name in enumerate(rows[header])]
+    return pd.DataFrame(rows[header + 1:], columns=columns)
 
 
 class League(object):
@@ -18,26 +126,45 @@ class League(object):
     def __init__(self, leagueId, seasonId, login=None):
         self.leagueId = ('leagueId', str(leagueId))
         self.seasonId = ('seasonId', str(seasonId))
-        self.leagueUrl = ('http://games.espn.com/flb/leagueoffice?' +
-                          urlencode((self.leagueId, self.seasonId)))
-        self.parser = etree.HTMLParser()
+        # Every page URL shares this league/season query string; encode it
+        # once rather than per request.
+        self._qs = urlencode((self.leagueId, self.seasonId))
+        self.leagueUrl = f'http://games.espn.com/flb/leagueoffice?{self._qs}'
+        if requests_cache is not None:
+            # League pages are near-invariant within the hour, so serve
+            # repeat fetches from a local sqlite cache.
+            self.session = requests_cache.CachedSession(
+                'espn_cache', backend='sqlite', expire_after=3600)
+        else:
+            self.session = requests.Session()
         self.login = login
+        # Parsed documents keyed by url; repeat table getters reuse the
+        # tree instead of re-fetching and re-parsing the page.
+        self._htmlCache = {}
         self.html = self._getHTML(self.leagueUrl, login=self.login)
         self.teamDict = self._getTeamDict()
+        self._teamIds = frozenset(self.teamDict)
         self.scoring = self._getScoring()
         # self.draft = self._getDraftType()
 
     def _getHTML(self, url, login=None):
         if login:
+            # The driver holds mutable page state, so logged-in fetches
+            # are never cached.
             login.get(url)
-            html = login.lxml
-        else:
-            html = etree.parse(url, self.parser).getroot()
+            return login.lxml
+        html = self._htmlCache.get(url)
+        if html is None:
+            # Parser instances are not thread-safe, so build one per call
+            # rather than sharing one across the download pool.
+            resp = self.session.get(url)
+            html = etree.fromstring(resp.content, etree.HTMLParser())
+            self._htmlCache[url] = html
         return html
 
     def _getScoring(self):
         settingsUrl = ('http://games.espn.com/flb/leaguesetup/settings?' +
-                       urlencode((self.leagueId, self.seasonId)))
+                       self._qs)
         html = self._getHTML(settingsUrl, login=self.login)
         scoring = html.xpath('//td[@class="settingLabel"]/following-sibling'
                              '::td/text()')[0].strip()
@@ -47,51 +174,63 @@ class League(object):
         """ Gets dict of team names and team Id numbers from league page.
         """
         teamIds = self.html.xpath('//ul[@id="games-tabs1"]/li/a/@href')
-        teamIds = [re.findall('teamId=(\d+)', i)[0] for i in teamIds]
+        teamIds = pd.Series(teamIds).str.extract(_TEAMID_RE, expand=False)
         teamNames = self.html.xpath('//ul[@id="games-tabs1"]/li/a/text()')
-        teamNames = [name.strip().upper().replace('  ', ' ') for name in
-                     teamNames]
+        teamNames = (pd.Series(teamNames).str.strip().str.upper()
+                     .str.replace('  ', ' ', regex=False))
         teamDict = dict(zip(teamIds, teamNames))
         return teamDict
 
     def _formatAuctionDraftTable(self, df):
-        reStr = '(?P<PLAYER>.+?), (?P<TEAM>\w+)\xa0(?P<POS>\w+)'\
-                '(?P<KEEPER>\xa0\xa0K$|$)'
-        df = df.join(df[1].str.extract(reStr, expand=True))
-        df.loc[df['KEEPER'] == u'\xa0\xa0K', 'KEEPER'] = True
-        df.loc[np.logical_not(df['KEEPER']), 'KEEPER'] = False
-        df.drop([0, 1, 2], axis=1, inplace=True)
-        return df
+        """ Extract PLAYER/TEAM/POS/KEEPER columns from the name cell.
+            Input: draft table dataframe
+            Output: extracted columns dataframe
+        """
+        ext = df[1].str.extract(_AUCTION_RE, expand=True)
+        # One vectorized comparison yields a bool column directly, instead
+        # of two masked object-dtype writes.
+        ext['KEEPER'] = ext['KEEPER'].values == u'\xa0\xa0K'
+        return ext
 
     def _formatAuctionTable(self, df):
         """ Format html auction table string to pandas dataframe.
             Input: html table str
             Output: pandas dataframe
         """
-        manager = df[0].ix[0]
-        df['MANAGER'] = manager
-        df.drop([0], inplace=True)
-        df['PICK'] = pd.to_numeric(df[0])
-        df['PRICE'] = pd.to_numeric(df[2].apply(lambda x: x[1:]))
-        df = self._formatAuctionDraftTable(df)
-        df = df[['MANAGER', 'PLAYER', 'PICK', 'TEAM', 'POS', 'PRICE',
-                 'KEEPER']]
-        return df
+        manager = df.iat[0, 0]
+        df = df.drop([0])
+        ext = self._formatAuctionDraftTable(df)
+        # Assemble the result in a single allocation rather than join +
+        # drop, which each copy the whole block manager.
+        return _categorize(
+            pd.DataFrame({'MANAGER': manager,
+                          'PLAYER': ext['PLAYER'].values,
+                          'PICK': pd.to_numeric(df[0]).values,
+                          'TEAM': ext['TEAM'].values,
+                          'POS': ext['POS'].values,
+                          'PRICE': pd.to_numeric(df[2].str[1:]).values,
+                          'KEEPER': ext['KEEPER'].values},
+                         columns=['MANAGER', 'PLAYER', 'PICK', 'TEAM',
+                                  'POS', 'PRICE', 'KEEPER']))
 
-    def _formatDraftTable(self, html):
+    def _formatDraftTable(self, df):
         """ Format html draft table string to pandas dataframe.
             Input: html table str
             Output: pandas dataframe
         """
-        rnd = df[0].ix[0].replace('ROUND ', '')
-        df.drop([0], inplace=True)
-        df['ROUND'] = rnd
-        df['PICK'] = pd.to_numeric(df[0])
-        df['MANAGER'] = df[2]
-        df = self._formatAuctionDraftTable(df)
-        df = df[['ROUND', 'PICK', 'MANAGER', 'PLAYER', 'TEAM', 'POS',
-                 'KEEPER']]
-        return df
+        rnd = df.iat[0, 0].replace('ROUND ', '')
+        df = df.drop([0])
+        ext = self._formatAuctionDraftTable(df)
+        return _categorize(
+            pd.DataFrame({'ROUND': rnd,
+                          'PICK': pd.to_numeric(df[0]).values,
+                          'MANAGER': df[2].values,
+                          'PLAYER': ext['PLAYER'].values,
+                          'TEAM': ext['TEAM'].values,
+                          'POS': ext['POS'].values,
+                          'KEEPER': ext['KEEPER'].values},
+                         columns=['ROUND', 'PICK', 'MANAGER', 'PLAYER',
+                                  'TEAM', 'POS', 'KEEPER']))
 
     def _formatDraft(self, df, draftType):
         if draftType == 'Auction Draft':
@@ -106,20 +245,23 @@ class League(object):
             Output: team or leaguewide draft results dataframe
         """
         if teamId:
-            assert str(teamId) in self.teamDict
-        draftUrl = ('http://games.espn.com/flb/tools/draftrecap?' +
-                    urlencode((self.leagueId, self.seasonId)))
+            assert teamId in self._teamIds
+        draftUrl = f'http://games.espn.com/flb/tools/draftrecap?{self._qs}'
         html = self._getHTML(draftUrl, login=self.login)
         draftType = html.xpath('//b[text()="Type: "]/following-sibling::text()'
                                )[0].strip()
         draftXpath = '//div[@class="games-fullcol games-fullcol-extramargin'\
                      '"]/table/tr/td/table'
         draftTables = html.xpath(draftXpath)
-        draftTable = pd.DataFrame()
+        # Accumulate and concat once; concat inside the loop recopies the
+        # whole accumulator on every iteration.
+        parts = []
         for table in draftTables:
-            dfTable = pd.read_html(tostring(table))[0]
-            df = self._formatDraft(dfTable, draftType)
-            draftTable = pd.concat([draftTable, df])
+            parts.append(self._formatDraft(_tableToDf(table), draftType))
+        # Per-table category codes differ, so concat falls back to object;
+        # re-categorize the combined frame.
+        draftTable = _categorize(pd.concat(parts, ignore_index=True,
+                                           sort=False))
         if teamId:
             return draftTable[draftTable['MANAGER'].str.upper() ==
                               self.teamDict[teamId]]
@@ -132,18 +274,18 @@ class League(object):
             Output: pandas dataframe
         """
         df.drop(df.shape[0]-1, inplace=True)
-        if df.iloc[:, 2].dtype == 'object':
+        if not pd.api.types.is_numeric_dtype(df.iloc[:, 2]):
             rows = df[df.iloc[:, 2] == '--'].index
             df.iloc[rows] = df.iloc[rows].replace(to_replace='--',
                                                   value=np.nan)
-        df = df.apply(pd.to_numeric, errors='ignore')
-        reStr = '^(?P<PLAYER>.+?), (?P<TEAM>\w+)\xa0(?P<POS>.+?)' \
-                '(?P<DTD>$|\xa0\xa0DTD$)'
-        df = df.join(df['PLAYER, TEAM POS'].str.extract(reStr, expand=True))
+        df = _convertNumericCols(df)
+        df = df.join(df['PLAYER, TEAM POS'].str.extract(_ACTIVE_RE,
+                                                        expand=True))
+        df['DTD'] = df['DTD'].values == u'\xa0\xa0DTD'
         df.drop('PLAYER, TEAM POS', axis=1, inplace=True)
-        df['POS'] = df['POS'].apply(lambda x: x.split(', '))
+        df['POS'] = df['POS'].str.split(', ', regex=False)
         # Drop extra columns
-        df = df.select(lambda x: not re.search('Unnamed: \d+', x), axis=1)
+        df = df.loc[:, ~df.columns.str.contains(_UNNAMED_RE)]
         return df
 
     def _downloadActiveStatsTable(self, teamId, batter=True):
@@ -151,23 +293,22 @@ class League(object):
             Input: teamId int, batter bool
             Output: team active stats dataframe
         """
-        assert str(teamId) in self.teamDict
+        assert teamId in self._teamIds
         teamName = self.teamDict[teamId]
-        teamId = ('teamId', teamId)
-        activeStatsUrl = ('http://games.espn.com/flb/activestats?' +
-                          urlencode((self.leagueId, self.seasonId, teamId)))
+        activeStatsUrl = (f'http://games.espn.com/flb/activestats?{self._qs}'
+                          f'&teamId={teamId}')
         if batter:
             html = self._getHTML(activeStatsUrl, login=self.login)
         else:
             html = self._getHTML(activeStatsUrl + '&filter=2',
                                  login=self.login)
-        htmlStr = (tostring(html.xpath(
-                   '//table[@class="playerTableTable tableBody"]')[0]))
-        dfTable = pd.read_html(htmlStr, header=1)[0]
-        df = self._formatActiveStatsTable(dfTable)
+        table = html.xpath('//table[@class="playerTableTable tableBody"]')[0]
+        df = self._formatActiveStatsTable(_tableToDf(table, header=1))
         df['MANAGER'] = teamName
         cols = df.columns.tolist()
-        return df[[cols[-1]] + cols[-5:-1] + cols[:-5]]
+        # POS holds lists here, which are unhashable, so it stays object.
+        return _categorize(df[[cols[-1]] + cols[-5:-1] + cols[:-5]],
+                           cols=('MANAGER', 'TEAM'))
 
     def _formatStandingsTable(self, df, columns):
         """ Format standings table to dataframe
@@ -176,38 +317,40 @@ class League(object):
         """
         df.columns = columns
         df.drop(df[df.iloc[:, 0].isnull()].index, inplace=True)
-        df = df.select(lambda x: not re.search('1\d', str(x)), axis=1)
-        return df
+        df = df.loc[:, ~df.columns.astype(str).str.contains(_SUBHEAD_RE)]
+        # read_html inferred numeric dtypes for the stat columns;
+        # _tableToDf hands back strings, so convert them here.
+        return _convertNumericCols(df)
 
     def _parseHeaders(self, table):
         """ Reorganize the multi-level headers to a single column that
             corresponds to the table data. Specifically tailored to ESPN's
             tables so small changes may really break this function.
         """
-        head = table.xpath('.//tr[@class="tableHead"]|'
-                           './/td[@class="tableHead"]')[0].text
-        subHeads = table.xpath('.//tr[@class="tableSubHead"]')
+        head = _HEAD_XP(table)[0].text
+        subHeads = _SUBHEAD_XP(table)
         assert len(subHeads) <= 2  # Haven't seen more than two subHeads
         noname = 10
         if len(subHeads) == 2:
             # Stats tables usually have two header rows
             for idx, subHead in enumerate(subHeads):
                 subHeadRow = []
-                for td in subHead.xpath('.//td'):
-                    if td.xpath('.//text()') == []:
+                for td in _TDS_XP(subHead):
+                    texts = _TEXTS_XP(td)
+                    colspan = td.get('colspan')
+                    if not texts:
                         # These are padding cells, we will remove them later
-                        subHeadRow += [noname]
+                        subHeadRow.append(noname)
                         noname += 1
-                    elif 'colspan' in td.attrib:
+                    elif colspan is not None:
                         # These are unnecessary titles, we will remove them
                         # later
-                        subHeadRow += (int(td.attrib['colspan']) *
-                                       [noname])
+                        subHeadRow.extend(int(colspan) * [noname])
                         noname += 1
                     else:
                         # These are the columns we want, sometimes the text
                         # is broken up.
-                        subHeadRow += [' '.join(td.xpath('.//text()'))]
+                        subHeadRow.append(' '.join(texts))
                 if idx == 0:
                     subHead1 = subHeadRow
                 if idx == 1:
@@ -217,8 +360,7 @@ class League(object):
                     columns = subHead1[:2] + subHeadRow + subHead1[-n:]
         else:
             # Standings tables usually have one header row, much simpler
-            subHead = [x.xpath('.//text()') for x in subHeads[0].
-                       xpath('.//td')]
+            subHead = [_TEXTS_XP(x) for x in _TDS_XP(subHeads[0])]
             columns = [name for lst in subHead for name in lst]
         return head, columns
 
@@ -229,13 +371,13 @@ class League(object):
             Output: league standings dataframe
         """
         standingsUrl = ('http://games.espn.com/flb/standings?view=official&' +
-                        urlencode((self.leagueId, self.seasonId)))
+                        self._qs)
         html = self._getHTML(standingsUrl, login=self.login)
         tables = html.xpath('//table[@class="tableBody"]')
         dfs = []
         for table in tables:
             head, columns = self._parseHeaders(table)
-            df = pd.read_html(tostring(table), skiprows=2)[0]
+            df = _tableToDf(table, skiprows=2)
             df.name = head
             dfs.append(self._formatStandingsTable(df, columns))
         return dfs
@@ -243,11 +385,21 @@ class League(object):
     def getLeagueActiveStatsTable(self, batter=True):
         """ Return league active stats dataframe
         """
-        activeTable = pd.DataFrame()
-        for teamId in self.teamDict:
-            df = self._downloadActiveStatsTable(teamId, batter=batter)
-            activeTable = pd.concat([activeTable, df])
-        return activeTable
+        if self.login:
+            # A selenium driver can only serve one request at a time.
+            dfs = [self._downloadActiveStatsTable(teamId, batter=batter)
+                   for teamId in self.teamDict]
+        else:
+            # Downloads are network-bound, so fetch all teams concurrently
+            # and let the session pool the connections.
+            with ThreadPoolExecutor(max_workers=len(self.teamDict)) as \
+                    executor:
+                futures = [executor.submit(self._downloadActiveStatsTable,
+                                           teamId, batter=batter)
+                           for teamId in self.teamDict]
+                dfs = [future.result() for future in futures]
+        return _categorize(pd.concat(dfs, ignore_index=True, sort=False),
+                           cols=('MANAGER', 'TEAM'))
 
     def getLeagueDraftTable(self):
         """ Return league auction results dataframe.
@@ -262,86 +414,93 @@ class League(object):
         return self._downloadStandingsTable()
 
 
-class Team(League):
-    """ Represents team specific data tables.
+class Team(object):
+    """ Represents team specific data tables. Wraps an existing League so
+        building several teams does not re-download the league pages.
         Parameters
         ----------
-        leagueId: league id number str or int
-        seasonId: season year str or int
+        league: League instance
         teamId: team id number str or int
-        driver: if the league is password protected, you will need to pass a
-        selenium webdriver in order to login to ESPN.
     """
-    def __init__(self, leagueId, seasonId, teamId, login=None):
-        super(Team, self).__init__(leagueId, seasonId, login=login)
+    def __init__(self, league, teamId):
+        self.league = league
         self.id = str(teamId)
-        self.teamId = ('teamId', str(teamId))
-        self.teamUrl = ('http://games.espn.com/flb/clubhouse?' + urlencode(
-                        (self.leagueId, self.seasonId, self.teamId)))
+        self.teamDict = league.teamDict
+        self.login = league.login
+        self._qs = league._qs
+        self.teamUrl = (f'http://games.espn.com/flb/clubhouse?{self._qs}'
+                        f'&teamId={self.id}')
         self.name = self.teamDict[self.id]
 
+    @classmethod
+    def fromIds(cls, leagueId, seasonId, teamId, login=None):
+        """ Build a Team and its League from raw id numbers, mirroring the
+            old Team(leagueId, seasonId, teamId) constructor.
+        """
+        return cls(League(leagueId, seasonId, login=login), teamId)
+
     def getActiveStatsTable(self, batter=True):
         """ Dataframe of team's active stats page. Choose between batter
             stats or pitcher stats.
             Input: batter bool
             Output: active stats dataframe
         """
-        return self._downloadActiveStatsTable(self.id, batter=batter)
+        return self.league._downloadActiveStatsTable(self.id, batter=batter)
 
     def getDraftTable(self):
         """ Return team auction results
         """
-        return self._downloadDraftTable(teamId=self.id)
+        return self.league._downloadDraftTable(teamId=self.id)
 
-    def _formatTransactionTable(self, htmlStr, tds):
-        """ Format transaction tables. In order to properly parse text in
-            Date and Detail columns, we need to parse HTML outside of pandas.
-            Input: htmlStr str and tds xpath objects
+    def _formatTransactionTable(self, table):
+        """ Format transaction tables. Date and Detail cells hold broken-up
+            text, so normalize it while walking the parsed rows; one walk
+            yields the header and every column.
+            Input: table lxml element
             Output: transaction table dataframe
         """
-        df = pd.read_html(htmlStr, header=1)[0]
-        dates = [' '.join(i.itertext()) for i in tds[::4]]
-        df['DATE'] = dates
-        details = [' '.join(i.itertext()).replace('  ', ' ').replace(' ,', ',')
-                   for i in tds[2::4]]
-        df['DETAIL'] = details
-        addDropKey = u'Transaction\xa0\xa0Add/Drop'
-        addDropStr = '(\w+) dropped (.+?), \w+ \w+ to (Waivers|Free Agency)'\
-                     '|(\w+) added (.+?), \w+ \w+ from (Waivers|Free Agency)'
-        addDrop = pd.Series(df[df['TYPE'].str.match(addDropKey)]['DETAIL'].str.
-                            findall(addDropStr))
-        addDrop = addDrop.apply(lambda x: [x[0][:3], x[1][:3:-1]])
-        addKey = u'Transaction\xa0\xa0Add'
-        addStr = '(\w+) added (.+?), \w+ \w+ from (Waivers|Free Agency)'
-        add = pd.Series(df[df['TYPE'].str.match(addKey)]['DETAIL'].str.
-                        findall(addStr))
-        add = add.apply(lambda x: [x[0][::-1]])
-        dropKey = u'Transaction\xa0\xa0Drop'
-        dropStr = '(\w+) dropped (.+?), \w+ \w+ to (Waivers|Free Agency)'
-        drop = pd.Series(df[df['TYPE'].str.match(dropKey)]['DETAIL'].str.
-                         findall(dropStr))
-        tradeKey = u'Transaction\xa0\xa0Trade Processed'
-        tradeStr = '(\w+) traded (.+?), \w+ \w+ to (\w+)'
-        trade = pd.Series(df[df['TYPE'].str.match(tradeKey)]['DETAIL'].str.
-                          findall(tradeStr))
-        transactions = pd.concat([addDrop, add, drop, trade])
-        transactions.name = 'TRANSACTION'
-        df = df.join(transactions)
+        columns = None
+        data = []
+        for tr in table.iterchildren('tr'):
+            if tr.get('class') == 'tableSubHead':
+                columns = [''.join(td.itertext()).strip()
+                           for td in tr.iterchildren('td')]
+                continue
+            if columns is None:
+                # read_html(header=1) dropped every row above the header;
+                # do the same whatever class the title cells carry.
+                continue
+            cells = [' '.join(td.itertext()).replace('  ', ' ')
+                     .replace(' ,', ',').strip()
+                     for td in tr.iterchildren('td')
+                     if td.get('class') != 'tableHead']
+            if cells:
+                data.append(cells)
+        df = pd.DataFrame(data, columns=columns)
+        # TYPE draws from a tiny vocabulary, so resolve the parser once
+        # per unique value and dispatch rows by category code instead of
+        # testing every key against every row.
+        typeCat = df['TYPE'].astype('category')
+        parsers = [_transactionParser(rowType)
+                   for rowType in typeCat.cat.categories]
+        df['TYPE'] = typeCat
+        # code is -1 for a NaN TYPE (e.g. colspan'd footer rows), which
+        # would otherwise negative-index into the last parser.
+        df['TRANSACTION'] = [np.nan if code < 0 or parsers[code] is None
+                             else parsers[code](detail)
+                             for code, detail in zip(typeCat.cat.codes,
+                                                     df['DETAIL'])]
         return df
 
     def _downloadTransactionTable(self, startDate, endDate):
-        start = ('startDate', startDate.strftime('%Y%m%d'))
-        end = ('endDate', endDate.strftime('%Y%m%d'))
-        activity = ('activityType', '2')
-        transactionUrl = ('http://games.espn.com/flb/recentactivity?' +
-                          urlencode((self.leagueId, self.seasonId, self.teamId,
-                                    activity, start, end)))
-        html = self._getHTML(transactionUrl, login=self.login)
-        htmlStr = tostring(html.xpath('//table[@class="tableBody"]')[0])
-        tds = html.xpath('//tr[not(@class="tableSubHead")]/td'
-                         '[not(@class="tableHead")]')[1:]
-        df = self._formatTransactionTable(htmlStr, tds)
-        return df
+        start = startDate.strftime('%Y%m%d')
+        end = endDate.strftime('%Y%m%d')
+        transactionUrl = (f'http://games.espn.com/flb/recentactivity?'
+                          f'{self._qs}&teamId={self.id}&activityType=2'
+                          f'&startDate={start}&endDate={end}')
+        html = self.league._getHTML(transactionUrl, login=self.login)
+        table = html.xpath('//table[@class="tableBody"]')[0]
+        return self._formatTransactionTable(table)
 
     def getTransactionTable(self, startDate, endDate):
         """ Dataframe of team's transactions. Adds a new column 'TRANSACTION'
@@ -56,8 +56,8 @@ setup(
 
         # Specify the Python versions you support here. In particular, ensure
         # that you indicate whether you support Python 2, Python 3 or both.
-        'Programming Language :: Python :: 2',
-        'Programming Language :: Python :: 2.7'
+        'Programming Language :: Python :: 3',
+        'Programming Language :: Python :: 3.6'
     ],
 
     # What does your project relate to?
@@ -78,7 +78,12 @@ setup(
     # your project is installed. For an analysis of "install_requires" vs pip's
     # requirements files see:
     # https://packaging.python.org/en/latest/requirements.html
-    install_requires=['numpy', 'pandas', 'lxml'],
+    install_requires=['numpy', 'pandas', 'lxml', 'requests'],
+
+    # Optional on-disk HTTP caching for repeat page fetches.
+    extras_require={
+        'cache': ['requests_cache'],
+    },
 
     # List additional groups of dependencies here (e.g. development
     # dependencies). You can install these using the following syntax,